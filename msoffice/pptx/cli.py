@@ -6,6 +6,7 @@ CLI for filling JSON data into PowerPoint slides.
 """
 
 import json
+import logging
 import os
 import sys
 import argparse
@@ -15,6 +16,10 @@ from pptx_fill_data_into_template import pptx_fill_data_from_json
 # CLI
 # ---------------------------
 if __name__ == "__main__":
+    # The library modules log through logging with a NullHandler default;
+    # enable INFO-level output for interactive CLI use
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
     parser = argparse.ArgumentParser(
         description="Fill JSON data into placeholders in PowerPoint slides."
     )
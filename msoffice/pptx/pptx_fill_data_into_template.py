@@ -36,12 +36,22 @@ Expected JSON specification:
 }
 """
 
+import functools
+import io
+import logging
+import multiprocessing
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
+from xml.sax.saxutils import escape
+
+from lxml import etree
 from PIL import Image, UnidentifiedImageError
 from pptx import Presentation
 from pptx.enum.text import MSO_AUTO_SIZE
-from pptx.util import Emu, Pt
+from pptx.oxml.ns import qn
+from pptx.util import Emu
 
 from font_size_calculator import (
     calculate_fitting_font_size,
@@ -56,10 +66,48 @@ from pptx_get_shape_font import (
 )
 
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
 MAX_TITLE_SIZE = 36
 MAX_FONT_SIZE = 24
 LABEL_SEPARATORS = ["：", ":"]
 
+# Matches the first label separator (fullwidth or ASCII colon) in one scan
+_LABEL_SEPARATOR_RE = re.compile("[：:]")
+
+# Characters not representable in XML 1.0 (control characters other than
+# tab/newline/carriage return, lone surrogates, and the two non-characters);
+# stripped from list items before XML emission
+_XML_UNSAFE_CHARS_RE = re.compile(
+    "[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff￾￿]"
+)
+
+# Images up to this size are read into memory once and the same bytes are
+# shared between the dimension probe and add_picture; larger images fall
+# back to path-based loading to avoid holding huge buffers
+_IMAGE_REUSE_MAX_BYTES = 16 * 1024 * 1024
+
+# Per-run caches keyed by object identity. Shapes inheriting from the same
+# layout/master chain trigger identical lxml walks in get_shape_font and
+# get_placeholder_paragraph_defaults. Both are cleared by
+# _clear_fill_caches() when a fill run completes, so stale ids never
+# outlive the objects they refer to.
+_shape_font_cache: Dict[int, Optional[str]] = {}
+_para_defaults_cache: Dict[int, Dict] = {}
+
+# Memoizes calculate_fitting_font_size results keyed by everything that
+# feeds the search (frame dimensions, items, font, spacing parameters), so
+# repeated renders of the same content skip the binary search entirely
+_fit_cache: Dict[Tuple, int] = {}
+
+
+def _clear_fill_caches() -> None:
+    """Clear the per-run shape/theme lookup caches."""
+    _shape_font_cache.clear()
+    _para_defaults_cache.clear()
+    _fit_cache.clear()
+
 # PowerPoint's internal line height factor for single line spacing.
 # This value is derived from PowerPoint's default behavior where the line height
 # is approximately 1.2 times the font size (120% of font size).
@@ -105,38 +153,37 @@ def _get_text_frame_dimensions(shape) -> Tuple[float, float]:
     """
     tf = shape.text_frame
 
+    # Read each lxml-backed property once; every access is an XML attribute
+    # fetch plus int parse
+    shape_width = shape.width
+    shape_height = shape.height
+    margin_left = tf.margin_left
+    margin_right = tf.margin_right
+    margin_top = tf.margin_top
+    margin_bottom = tf.margin_bottom
+
     # Calculate effective dimensions (excluding margins)
-    effective_width = shape.width - tf.margin_left - tf.margin_right
-    effective_height = shape.height - tf.margin_top - tf.margin_bottom
+    effective_width = shape_width - margin_left - margin_right
+    effective_height = shape_height - margin_top - margin_bottom
 
     # Convert EMU to points
     width_pt = Emu(effective_width).pt
     height_pt = Emu(effective_height).pt
 
-    print(
-        f"[DEBUG] Shape '{shape.name}' "
-        f"dimensions: width={shape.width} EMU ({width_pt:.1f} pt), "
-        f"height={shape.height} EMU ({height_pt:.1f} pt)"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Shape '%s' dimensions: width=%s EMU (%.1f pt), "
+            "height=%s EMU (%.1f pt)",
+            shape.name,
+            shape_width,
+            width_pt,
+            shape_height,
+            height_pt,
+        )
 
     return width_pt, height_pt
 
 
-def _get_pptx_shape_by_name(slide, name: str) -> Optional[Any]:
-    """
-    Get shape in slide by its name.
-    Args:
-        slide: PowerPoint slide object.
-        name (str): Name of the shape to find.
-    Returns:
-        shape: The shape object if found; otherwise, None.
-    """
-    for s in slide.shapes:
-        if s.name == name:
-            return s
-    return None
-
-
 def _split_label_body(text: str) -> Tuple[str, str]:
     """
     Split text into label and body at the first colon (： or :).
@@ -145,11 +192,11 @@ def _split_label_body(text: str) -> Tuple[str, str]:
     Returns:
         Tuple[str, str]: A tuple containing the label and body.
     """
-    idx = text.find(LABEL_SEPARATORS[0])
-    if idx < 0:
-        idx = text.find(LABEL_SEPARATORS[1])
-    if idx < 0:
+    # One regex scan finds either separator instead of two str.find passes
+    m = _LABEL_SEPARATOR_RE.search(text)
+    if m is None:
         return text, ""
+    idx = m.start()
     label = text[:idx]
     body = text[idx + 1 :].lstrip()  # Remove colon and trim leading whitespace
     return label, body
@@ -184,14 +231,20 @@ def _fill_text(
     del is_title  # Reserved for future: differentiate title vs body text sizing
     del max_font_size  # Reserved for future: cap the calculated font size
 
-    if not hasattr(shape, "text_frame") or shape.text_frame is None:
-        print(f"[WARN] Shape '{shape.name}' has no text_frame; skipped text injection.")
+    tf = getattr(shape, "text_frame", None)
+    if tf is None:
+        logger.warning(
+            "Shape '%s' has no text_frame; skipped text injection.", shape.name
+        )
         return
 
-    tf = shape.text_frame
     tf.clear()
-    tf.word_wrap = True  # enable word wrap
-    tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE  # shrink text to fit
+    # Write bodyPr attributes only when they differ from the template's
+    # current values; each write is an lxml attribute set
+    if tf.word_wrap is not True:
+        tf.word_wrap = True  # enable word wrap
+    if tf.auto_size != MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE:
+        tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE  # shrink text to fit
 
     p = tf.paragraphs[0]
     p.text = text
@@ -225,7 +278,7 @@ def _fill_image(slide, shape, path) -> None:
         None
     """
     if not os.path.isfile(path):
-        print(f"[WARN] Image file not found: {path}; skipped image injection.")
+        logger.warning("Image file not found: %s; skipped image injection.", path)
         return
 
     # Get image size (pixels)
@@ -233,18 +286,34 @@ def _fill_image(slide, shape, path) -> None:
     # - UnidentifiedImageError: corrupted file or unsupported format
     # - PermissionError: no read permission
     # - OSError: general I/O errors
+    #
+    # Reasonably sized images are read into memory once: PIL probes the
+    # dimensions from the buffer and the same buffer is handed to
+    # add_picture, so the file is not opened and read a second time.
     try:
-        with Image.open(path) as im:
-            img_w_px, img_h_px = im.size
+        if os.path.getsize(path) <= _IMAGE_REUSE_MAX_BYTES:
+            with open(path, "rb") as f:
+                image_data = f.read()
+            # Separate BytesIO views: Image.close() also closes its buffer
+            with Image.open(io.BytesIO(image_data)) as im:
+                img_w_px, img_h_px = im.size
+            image_source = io.BytesIO(image_data)
+        else:
+            image_source = path
+            with Image.open(path) as im:
+                img_w_px, img_h_px = im.size
     except (UnidentifiedImageError, PermissionError, OSError) as e:
-        print(f"[WARN] Could not open image file '{path}': {e}; skipped image injection.")
+        logger.warning(
+            "Could not open image file '%s': %s; skipped image injection.", path, e
+        )
         return
 
-    # Get frame size (EMU -> float)
-    f_left = float(shape.left)
-    f_top = float(shape.top)
-    f_w = float(shape.width)
-    f_h = float(shape.height)
+    # Get frame size (EMU -> float); read each lxml-backed property once
+    left, top, width, height = shape.left, shape.top, shape.width, shape.height
+    f_left = float(left)
+    f_top = float(top)
+    f_w = float(width)
+    f_h = float(height)
     frame_ratio = f_w / f_h
     img_ratio = img_w_px / img_h_px
 
@@ -261,27 +330,87 @@ def _fill_image(slide, shape, path) -> None:
     pic_left = f_left + (f_w - pic_w) / 2
     pic_top = f_top + (f_h - pic_h) / 2
 
-    # Add image (EMU specified)
+    # Add image (EMU specified); construct the Length wrappers once up front
+    pic_left_emu = Emu(int(pic_left))
+    pic_top_emu = Emu(int(pic_top))
+    pic_w_emu = Emu(int(pic_w))
+    pic_h_emu = Emu(int(pic_h))
     pic = slide.shapes.add_picture(
-        path,
-        Emu(int(pic_left)),
-        Emu(int(pic_top)),
-        width=Emu(int(pic_w)),
-        height=Emu(int(pic_h)),
+        image_source,
+        pic_left_emu,
+        pic_top_emu,
+        width=pic_w_emu,
+        height=pic_h_emu,
     )
     pic.name = shape.name + "_Fit"
 
     # Remove original frame (comment out if not needed)
     try:
         shape.element.getparent().remove(shape.element)
-        print(f"[INFO] Replaced frame by '{shape.name}_Fit' overlay for '{shape.name}'")
+        logger.info(
+            "Replaced frame by '%s_Fit' overlay for '%s'", shape.name, shape.name
+        )
     # pylint: disable=broad-except
     except Exception as e:
-        print(
-            f"[INFO] Could not remove original frame '{shape.name}'. Kept overlay. Reason: {e}"
+        logger.info(
+            "Could not remove original frame '%s'. Kept overlay. Reason: %s",
+            shape.name,
+            e,
         )
 
 
+_DRAWINGML_NS_URI = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+
+def _build_list_paragraphs(
+    items: List[str], font_size_pt: Optional[int]
+) -> List[Any]:
+    """
+    Build the <a:p> elements for a list fill as one parsed XML fragment.
+
+    Each item becomes a paragraph with a bold label run and, when the item
+    contains a separator, a normal body run — the same structure the
+    per-run python-pptx API produced, but assembled as a single XML string
+    and parsed once instead of mutating the tree run by run.
+
+    Args:
+        items (List[str]): List of text items to fill.
+        font_size_pt (Optional[int]): Font size applied to every run, or
+            None to leave run sizes unset (auto-fit mode).
+    Returns:
+        List of <a:p> lxml elements ready to append to a txBody.
+    """
+    # sz is specified in hundredths of a point per DrawingML
+    size_attr = f' sz="{font_size_pt * 100}"' if font_size_pt is not None else ""
+    separator = LABEL_SEPARATORS[0]
+
+    # First pass: reduce each item to plain (text, bold) run tuples so the
+    # splitting/stripping logic stays separate from XML emission
+    run_lists: List[List[Tuple[str, bool]]] = []
+    for line in items:
+        label, body = _split_label_body(line)
+        runs = [((label or line).strip(), True)]
+        if body:
+            runs.append((separator + body, False))
+        run_lists.append(runs)
+
+    # Second pass: emit the XML in one string build + one parse. Characters
+    # XML 1.0 cannot carry are stripped so fromstring cannot fail on them.
+    paragraphs = []
+    for runs in run_lists:
+        runs_xml = "".join(
+            f'<a:r><a:rPr b="{int(bold)}"{size_attr}/>'
+            f"<a:t>{escape(_XML_UNSAFE_CHARS_RE.sub('', text))}</a:t></a:r>"
+            for text, bold in runs
+        )
+        paragraphs.append(f"<a:p>{runs_xml}</a:p>")
+
+    fragment = etree.fromstring(
+        f'<root xmlns:a="{_DRAWINGML_NS_URI}">{"".join(paragraphs)}</root>'
+    )
+    return list(fragment)
+
+
 def _fill_list(
     shape,
     items: List[str],
@@ -305,29 +434,45 @@ def _fill_list(
     Returns:
         None
     """
-    if not hasattr(shape, "text_frame") or shape.text_frame is None:
-        print(f"[WARN] Shape '{shape.name}' has no text_frame; skipped text injection.")
+    tf = getattr(shape, "text_frame", None)
+    if tf is None:
+        logger.warning(
+            "Shape '%s' has no text_frame; skipped text injection.", shape.name
+        )
         return
 
-    tf = shape.text_frame
     max_size = max_font_size if max_font_size else MAX_FONT_SIZE
 
     # Step 1: Determine font name from shape properties or theme fonts
-    # get_shape_font handles the full priority chain including theme fallback
-    font_name = get_shape_font(shape, theme_fonts)
+    # get_shape_font handles the full priority chain including theme fallback.
+    # Cached per shape element: placeholders sharing a layout/master chain
+    # repeat the same XML walks otherwise.
+    shape_key = id(shape.element)
+    if shape_key in _shape_font_cache:
+        font_name = _shape_font_cache[shape_key]
+    else:
+        font_name = get_shape_font(shape, theme_fonts)
+        _shape_font_cache[shape_key] = font_name
     calculated_font_size: Optional[int] = None
 
     # Step 2: Calculate fitting font size
     if font_name and font_dir:
-        print(f"[INFO] Using font: {font_name}")
+        logger.info("Using font: %s", font_name)
 
-        # Step 2.1: Get paragraph defaults from template
-        para_defaults = get_placeholder_paragraph_defaults(shape)
-        # Use direct key access for type safety with TypedDict
-        line_spacing = para_defaults['line_spacing'] or 1.0
-        line_spacing_type = para_defaults['line_spacing_type']
-        space_before_pt = para_defaults['space_before_pt']
-        space_after_pt = para_defaults['space_after_pt']
+        # Step 2.1: Get paragraph defaults from template (cached per shape)
+        if shape_key in _para_defaults_cache:
+            para_defaults = _para_defaults_cache[shape_key]
+        else:
+            para_defaults = get_placeholder_paragraph_defaults(shape)
+            _para_defaults_cache[shape_key] = para_defaults
+        # Use direct key access for type safety with TypedDict; unpack the
+        # dict into locals in one step for the per-placeholder hot path
+        line_spacing, line_spacing_type, space_before_pt, space_after_pt = (
+            para_defaults['line_spacing'] or 1.0,
+            para_defaults['line_spacing_type'],
+            para_defaults['space_before_pt'],
+            para_defaults['space_after_pt'],
+        )
 
         # Determine if line spacing is fixed (absolute points) or ratio-based (percentage)
         # Per ISO/IEC 29500-1:
@@ -337,68 +482,108 @@ def _fill_list(
         # https://learn.microsoft.com/en-us/dotnet/api/documentformat.openxml.drawing.linespacing
         is_fixed_line_spacing = line_spacing_type == LINE_SPACING_TYPE_FIXED
 
-        print(
-            f"[INFO] Paragraph defaults: line_spacing={line_spacing}, "
-            f"type={line_spacing_type}, is_fixed={is_fixed_line_spacing}, "
-            f"space_before={space_before_pt}pt, space_after={space_after_pt}pt"
+        logger.info(
+            "Paragraph defaults: line_spacing=%s, type=%s, is_fixed=%s, "
+            "space_before=%spt, space_after=%spt",
+            line_spacing,
+            line_spacing_type,
+            is_fixed_line_spacing,
+            space_before_pt,
+            space_after_pt,
         )
 
         # Step 2.2: Get text frame dimensions and calculate appropriate font size
         width_pt, height_pt = _get_text_frame_dimensions(shape)
-        try:
-            calculated_font_size = calculate_fitting_font_size(
-                width_pt=width_pt,
-                height_pt=height_pt,
-                items=items,
-                max_size=max_size,
-                font_name=font_name,
-                font_dir=font_dir,
-                line_spacing=line_spacing,
-                space_before_pt=space_before_pt,
-                space_after_pt=space_after_pt,
-                line_height_factor=POWERPOINT_LINE_HEIGHT_FACTOR,
-                is_fixed_line_spacing=is_fixed_line_spacing,
-            )
-            print(
-                f"[INFO] Applied font size: {calculated_font_size} pt (max: {max_size} pt)"
+
+        # Memoize on everything the search depends on: identical content in
+        # identically sized frames (common across batch renders) reuses the
+        # previous answer. An empty list trivially fits at the maximum size.
+        fit_key = (
+            round(width_pt, 2),
+            round(height_pt, 2),
+            tuple(items),
+            max_size,
+            font_name,
+            round(line_spacing, 3),
+            space_before_pt,
+            space_after_pt,
+            is_fixed_line_spacing,
+        )
+        if not items:
+            calculated_font_size = max_size
+        elif fit_key in _fit_cache:
+            calculated_font_size = _fit_cache[fit_key]
+            logger.info(
+                "Applied font size: %s pt (max: %s pt, cached)",
+                calculated_font_size,
+                max_size,
             )
-        except ValueError as e:
-            print(f"[WARN] Font size calculation failed: {e}")
-            print("[WARN] Falling back to auto-fit mode (TEXT_TO_FIT_SHAPE)")
-            calculated_font_size = None
+        else:
+            try:
+                calculated_font_size = calculate_fitting_font_size(
+                    width_pt=width_pt,
+                    height_pt=height_pt,
+                    items=items,
+                    max_size=max_size,
+                    font_name=font_name,
+                    font_dir=font_dir,
+                    line_spacing=line_spacing,
+                    space_before_pt=space_before_pt,
+                    space_after_pt=space_after_pt,
+                    line_height_factor=POWERPOINT_LINE_HEIGHT_FACTOR,
+                    is_fixed_line_spacing=is_fixed_line_spacing,
+                )
+                _fit_cache[fit_key] = calculated_font_size
+                logger.info(
+                    "Applied font size: %s pt (max: %s pt)",
+                    calculated_font_size,
+                    max_size,
+                )
+            except ValueError as e:
+                logger.warning("Font size calculation failed: %s", e)
+                logger.warning("Falling back to auto-fit mode (TEXT_TO_FIT_SHAPE)")
+                calculated_font_size = None
     else:
         if not font_name:
-            print("[WARN] Could not determine font; skipping font size setting")
+            logger.warning("Could not determine font; skipping font size setting")
         elif not font_dir:
-            print("[WARN] Font directory not specified; skipping font size setting")
+            logger.warning("Font directory not specified; skipping font size setting")
 
     # Step 3: Fill with actual content and apply calculated font size (if available)
     tf.clear()
-    tf.word_wrap = True  # enable word wrap
-    tf.auto_size = (
+    # Write bodyPr attributes only when they differ from the template's
+    # current values; each write is an lxml attribute set
+    if tf.word_wrap is not True:
+        tf.word_wrap = True  # enable word wrap
+    target_auto_size = (
         MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE  # shrink text to fit if calculated_font_size is None
         if calculated_font_size is None
         else MSO_AUTO_SIZE.NONE  # disable auto size, use manual font size
     )
-
-    for i, line in enumerate(items):
-        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-
-        # 2-run with label and body
-        label, body = _split_label_body(line)
-        # First run: label in bold
-        run1 = p.add_run()
-        run1.text = label.strip() if label else line.strip()
-        run1.font.bold = True
-        if calculated_font_size is not None:
-            run1.font.size = Pt(calculated_font_size)
-        # Second run: body in normal
-        if body:
-            run2 = p.add_run()
-            run2.text = LABEL_SEPARATORS[0] + body
-            run2.font.bold = False
-            if calculated_font_size is not None:
-                run2.font.size = Pt(calculated_font_size)
+    if tf.auto_size != target_auto_size:
+        tf.auto_size = target_auto_size
+
+    # Build all paragraphs as one XML fragment and attach them in a single
+    # pass, replacing the per-run python-pptx mutations (each of which is
+    # an lxml tree edit) with one parse + N appends. tf.clear() above left
+    # exactly one empty paragraph that keeps the template's pPr/endParaRPr;
+    # the first item's runs move into it (before endParaRPr) so those
+    # properties survive, later items append as fresh paragraphs, and an
+    # empty item list leaves the empty paragraph in place — a txBody with
+    # no <a:p> would be schema-invalid per ISO/IEC 29500-1 CT_TextBody.
+    # pylint: disable=protected-access
+    tx_body = tf._txBody
+    new_paragraphs = _build_list_paragraphs(items, calculated_font_size)
+    if new_paragraphs:
+        first_p = tx_body.find(qn("a:p"))
+        end_para_rpr = first_p.find(qn("a:endParaRPr"))
+        for run_elem in list(new_paragraphs[0]):
+            if end_para_rpr is not None:
+                end_para_rpr.addprevious(run_elem)
+            else:
+                first_p.append(run_elem)
+        for p_elem in new_paragraphs[1:]:
+            tx_body.append(p_elem)
 
     # Note: fit_text() does not work properly with multi-byte characters
     # No font settings are applied; template's default formatting is preserved
@@ -413,23 +598,124 @@ def _fill_list(
     return
 
 
+# Placeholder type -> fill handler dispatch table. One dict lookup replaces
+# the chained string comparisons in the main loop; each handler adapts the
+# common (slide, shape, placeholder value, context) signature to the
+# underlying fill function.
+_HANDLERS: Dict[str, Any] = {
+    "text": lambda slide, shp, v, ctx: _fill_text(
+        shp, v.get("value", ""), v.get("isTitle", False), ctx["max_font_size"]
+    ),
+    "image": lambda slide, shp, v, ctx: _fill_image(slide, shp, v.get("value", "")),
+    "list": lambda slide, shp, v, ctx: _fill_list(
+        shp, v.get("value", []), ctx["max_font_size"], ctx["font_dir"], ctx["theme_fonts"]
+    ),
+}
+
+
+# Templates above this size are streamed from disk instead of being held
+# in the in-memory template cache
+_TEMPLATE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template_bytes(path: str, mtime_ns: int) -> bytes:
+    """
+    Read a template file into memory, cached per (path, mtime).
+
+    Repeated fills of the same template (common in service workloads) reuse
+    the bytes instead of re-reading from disk; the mtime key invalidates the
+    cached entry when the file is edited.
+
+    Args:
+        path (str): Path to the template PPTX file.
+        mtime_ns (int): File modification time in nanoseconds (cache key).
+    Returns:
+        bytes: The raw template file contents.
+    """
+    del mtime_ns  # Participates in the cache key only
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _open_template(path: str):
+    """
+    Open a template PPTX as a Presentation, using the cached bytes when
+    the file is small enough to hold in memory.
+
+    Args:
+        path (str): Path to the template PPTX file.
+    Returns:
+        Presentation: The loaded python-pptx Presentation object.
+    """
+    stat = os.stat(path)
+    if stat.st_size > _TEMPLATE_CACHE_MAX_BYTES:
+        return Presentation(path)
+    return Presentation(io.BytesIO(_load_template_bytes(path, stat.st_mtime_ns)))
+
+
+def clear_template_cache() -> None:
+    """Clear the in-memory template bytes cache."""
+    _load_template_bytes.cache_clear()
+
+
+def _validate_placeholders(phs: Dict) -> List[Tuple[str, str, Dict]]:
+    """
+    Validate placeholder entries once, before the fill loop.
+
+    Coerces maxFontSize to an int or None, drops entries with a missing
+    name/type, and lowercases the type up front so the fill loop does no
+    re-validation or repeated .lower() calls per placeholder.
+
+    Args:
+        phs (Dict): The placeholders mapping from the JSON payload.
+    Returns:
+        List[Tuple[str, str, Dict]]: (name, lowercased type, entry) tuples
+            for the valid entries, in payload order.
+    """
+    validated: List[Tuple[str, str, Dict]] = []
+    for ph_value in phs.values():
+        name = ph_value.get("name")
+        ph_type = ph_value.get("type")
+        if ph_type is None or name is None:
+            logger.warning("Placeholder name/type missing; skipped.")
+            continue
+        max_font_size = ph_value.get("maxFontSize")
+        if max_font_size is not None and not isinstance(max_font_size, int):
+            logger.warning("maxFontSize should be an integer; ignoring.")
+            ph_value["maxFontSize"] = None
+        validated.append((name, ph_type.lower(), ph_value))
+    return validated
+
+
 # ---------------------------
 # Main fill function
 # ---------------------------
-def pptx_fill_data_from_json(json_data: Dict) -> None:
+def _fill_loaded_presentation(
+    prs,
+    json_data: Dict,
+    theme_fonts: Dict[str, Optional[str]],
+    return_bytes: bool = False,
+) -> Optional[bytes]:
     """
-    Fill data into PowerPoint placeholders from JSON payload.
+    Fill placeholders of one slide in an already-loaded Presentation and save.
+
+    Shared by the single-job and batch entry points: the caller owns loading
+    the template and resolving theme fonts, so batch workloads can pay those
+    costs once per template instead of once per job.
+
     Args:
-        json_data (Dict): JSON payload with templatePptx, outputPptx, slideIndex, placeholders.
+        prs: Loaded python-pptx Presentation object.
+        json_data (Dict): JSON payload with outputPptx, slideIndex, placeholders.
+        theme_fonts (Dict): Theme fonts resolved from the presentation.
+        return_bytes (bool): Serialize to memory and return the PPTX bytes
+            instead of writing outputPptx to disk.
     Returns:
-        None.
+        Optional[bytes]: The PPTX bytes when return_bytes is set, else None.
     Raises:
-        FileNotFoundError: If the template PPTX file is not found.
         IndexError: If the slideIndex is out of range.
         ValueError: If the slideIndex is not an integer.
     """
-
-    template_pptx = json_data.get("templatePptx", "")
     output_pptx = json_data.get("outputPptx", "output.pptx")
     try:
         slide_index = int(json_data.get("slideIndex", 0))
@@ -439,6 +725,82 @@ def pptx_fill_data_from_json(json_data: Dict) -> None:
     phs = json_data.get("placeholders", {})
     font_dir = json_data.get("fontDir")  # Optional directory to search for fonts
 
+    if slide_index < 0 or slide_index >= len(prs.slides):
+        raise IndexError(
+            f"[ERROR] slideIndex out of range: {slide_index} (0..{len(prs.slides)-1})"
+        )
+    slide = prs.slides[slide_index]
+    logger.info("Loaded PowerPoint slide: Index[%s]", slide_index)
+
+    # Index shapes by name once: each placeholder lookup becomes a dict get
+    # instead of a linear scan over slide.shapes
+    shape_index: Dict[str, Any] = {s.name: s for s in slide.shapes}
+
+    for name, ph_type, ph_value in _validate_placeholders(phs):
+        max_font_size = ph_value.get("maxFontSize")
+
+        logger.info("Filling placeholder '%s' ...", name)
+        shp = shape_index.get(name)
+        if shp:
+            handler = _HANDLERS.get(ph_type)
+            if handler is None:
+                logger.warning("Unknown placeholder type; skipped.")
+                continue
+            ctx = {
+                "max_font_size": max_font_size,
+                "font_dir": font_dir,
+                "theme_fonts": theme_fonts,
+            }
+            handler(slide, shp, ph_value, ctx)
+            if ph_type == "image":
+                # _fill_image removes the original frame shape; drop it from
+                # the index so a later lookup cannot return the dead element
+                shape_index.pop(name, None)
+
+            logger.info("Filled data into '%s'.", name)
+        else:
+            logger.warning("Shape '%s' not found.", name)
+
+    if return_bytes:
+        buf = io.BytesIO()
+        prs.save(buf)
+        logger.info("Filled slide serialized to memory")
+        return buf.getvalue()
+
+    # Write to a sibling temp file and move it into place so a crash
+    # mid-save never leaves a torn output file visible
+    tmp_path = output_pptx + ".tmp"
+    try:
+        prs.save(tmp_path)
+        os.replace(tmp_path, output_pptx)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    logger.info("Filled slide saved to : %s", output_pptx)
+    return None
+
+
+def pptx_fill_data_from_json(
+    json_data: Dict, return_bytes: bool = False
+) -> Optional[bytes]:
+    """
+    Fill data into PowerPoint placeholders from JSON payload.
+    Args:
+        json_data (Dict): JSON payload with templatePptx, outputPptx, slideIndex, placeholders.
+        return_bytes (bool): Return the filled PPTX as bytes instead of
+            writing outputPptx to disk (for callers streaming the result
+            onward without a disk round-trip).
+    Returns:
+        Optional[bytes]: The PPTX bytes when return_bytes is set, else None.
+    Raises:
+        FileNotFoundError: If the template PPTX file is not found.
+        IndexError: If the slideIndex is out of range.
+        ValueError: If the slideIndex is not an integer.
+    """
+    template_pptx = json_data.get("templatePptx", "")
+    font_dir = json_data.get("fontDir")  # Optional directory to search for fonts
+
     # Initialize font system early if fontDir is specified
     # This builds the font name mapping cache once, avoiding repeated scans
     if font_dir:
@@ -447,54 +809,126 @@ def pptx_fill_data_from_json(json_data: Dict) -> None:
     if not template_pptx or not os.path.isfile(template_pptx):
         raise FileNotFoundError(f"[ERROR] Template not found: {template_pptx}")
 
-    prs = Presentation(template_pptx)
-    print(f"[INFO] Loaded PowerPoint template file: {template_pptx}")
+    prs = _open_template(template_pptx)
+    logger.info("Loaded PowerPoint template file: %s", template_pptx)
 
-    # Get theme fonts for font resolution
+    # Get theme fonts for font resolution (get_theme_fonts caches per
+    # presentation part, so repeat fills of a cached template are cheap)
     theme_fonts = get_theme_fonts(prs)
 
-    if slide_index < 0 or slide_index >= len(prs.slides):
-        raise IndexError(
-            f"[ERROR] slideIndex out of range: {slide_index} (0..{len(prs.slides)-1})"
+    try:
+        result = _fill_loaded_presentation(
+            prs, json_data, theme_fonts, return_bytes=return_bytes
         )
-    slide = prs.slides[slide_index]
-    print(f"[INFO] Loaded PowerPoint slide: Index[{slide_index}]")
+    finally:
+        # Clear caches even when the fill raises: the id()-keyed shape
+        # caches must not survive into a retry, where recycled object
+        # addresses would resolve against a dead presentation's entries
+        clear_font_cache()
+        _clear_fill_caches()
+    return result
 
-    for _, ph_value in phs.items():
-        name = ph_value.get("name")
-        ph_type = ph_value.get("type")
-        if ph_type is None or name is None:
-            print("[WARN] Placeholder name/type missing; skipped.")
-            continue
-        is_title = ph_value.get("isTitle", False)
-        max_font_size = ph_value.get("maxFontSize")
-        if max_font_size is not None and not isinstance(max_font_size, int):
-            print("[WARN] maxFontSize should be an integer; ignoring.")
-            max_font_size = None
 
-        print(f"[INFO] Filling placeholder '{name}' ...")
-        shp = _get_pptx_shape_by_name(slide, name)
-        if shp:
-            ph_type = ph_type.lower()
-            if ph_type == "text":
-                _fill_text(shp, ph_value.get("value", ""), is_title, max_font_size)
-            elif ph_type == "image":
-                _fill_image(slide, shp, ph_value.get("value", ""))
-            elif ph_type == "list":
-                _fill_list(
-                    shp, ph_value.get("value", []), max_font_size, font_dir, theme_fonts
-                )
-            else:
-                print("[WARN] Unknown placeholder type; skipped.")
-                continue
+def _process_one_job(job: Dict) -> None:
+    """
+    Run one fill job in a worker process.
+
+    Module-level so it is picklable by ProcessPoolExecutor; delegates to
+    the single-job entry point.
+
+    Args:
+        job (Dict): JSON payload as accepted by pptx_fill_data_from_json.
+    Returns:
+        None.
+    """
+    pptx_fill_data_from_json(job)
 
-            print(f"[INFO] Filled data into '{name}'.")
-        else:
-            print(f"[WARN] Shape '{name}' not found.")
 
-    prs.save(output_pptx)
-    print(f"[INFO] Filled slide saved to : {output_pptx}")
+def pptx_fill_data_from_json_batch(jobs: List[Dict], parallel: bool = True) -> None:
+    """
+    Fill data into PowerPoint placeholders for a batch of JSON payloads.
+
+    When parallel is enabled, more than one job is queued, the platform
+    supports the fork start method, and every job writes a distinct output
+    file, jobs fan out across CPU cores with ProcessPoolExecutor — python-pptx
+    and lxml are not safe for concurrent mutation in threads, but independent
+    output decks can be produced in separate processes. Callers must invoke
+    this from an ``if __name__ == "__main__":`` guard (or an imported module)
+    as required by concurrent.futures.
+
+    Otherwise jobs run serially, grouped by templatePptx so the template ZIP
+    is unzipped and parsed once per template instead of once per job: the
+    loaded template is snapshotted to an in-memory buffer and each job works
+    on a fresh Presentation parsed from that buffer. Theme fonts are resolved
+    once per template and the font caches persist across the whole batch,
+    only being cleared when every job has finished.
+
+    Args:
+        jobs (List[Dict]): JSON payloads as accepted by pptx_fill_data_from_json.
+        parallel (bool): Allow fanning jobs out across processes.
+    Returns:
+        None.
+    Raises:
+        FileNotFoundError: If a template PPTX file is not found.
+        IndexError: If a slideIndex is out of range.
+        ValueError: If a slideIndex is not an integer.
+    """
+    # Parallel path: one process per job, fork start method so loaded
+    # modules (and any warm font caches) are copy-on-write shared.
+    # Duplicate output paths force the serial path so jobs cannot race
+    # on the same file.
+    output_paths = [job.get("outputPptx", "output.pptx") for job in jobs]
+    if (
+        parallel
+        and len(jobs) > 1
+        and len(set(output_paths)) == len(output_paths)
+        and "fork" in multiprocessing.get_all_start_methods()
+    ):
+        mp_context = multiprocessing.get_context("fork")
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=mp_context
+        ) as executor:
+            # list() drains the iterator so worker exceptions propagate
+            list(executor.map(_process_one_job, jobs))
+        return
 
-    # Clear font cache to free memory after processing
-    clear_font_cache()
+    # Serial path: group jobs by template, preserving first-seen template order
+    jobs_by_template: Dict[str, List[Dict]] = {}
+    for job in jobs:
+        template_pptx = job.get("templatePptx", "")
+        if not template_pptx or not os.path.isfile(template_pptx):
+            raise FileNotFoundError(f"[ERROR] Template not found: {template_pptx}")
+        jobs_by_template.setdefault(template_pptx, []).append(job)
+
+    try:
+        for template_pptx, template_jobs in jobs_by_template.items():
+            prs_base = _open_template(template_pptx)
+            logger.info("Loaded PowerPoint template file: %s", template_pptx)
+
+            theme_fonts = get_theme_fonts(prs_base)
+
+            # Snapshot the loaded template once; re-parsing the in-memory
+            # bytes per job is cheaper than re-reading and unzipping the
+            # file from disk each time
+            buf = io.BytesIO()
+            prs_base.save(buf)
+            template_bytes = buf.getvalue()
+
+            for job in template_jobs:
+                font_dir = job.get("fontDir")
+                if font_dir:
+                    initialize_font_system(font_dir)
+                prs = Presentation(io.BytesIO(template_bytes))
+                _fill_loaded_presentation(prs, job, theme_fonts)
+                # The shape caches key by element id(); once this job's
+                # presentation is released those ids may be reused by the
+                # next job's elements, so drop them between jobs
+                _shape_font_cache.clear()
+                _para_defaults_cache.clear()
+    finally:
+        # Clear caches once at the end so font metrics and shape lookups
+        # are shared across all jobs in the batch
+        clear_font_cache()
+        _clear_fill_caches()
     return
@@ -9,16 +9,149 @@ presentations and shapes, following the Open XML (ISO/IEC 29500-1) specification
 for font inheritance and theme font resolution.
 """
 
+import logging
+import math
+import weakref
 from typing import Any, Dict, Literal, Optional, TypedDict
 
 from lxml import etree
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.oxml.ns import qn
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
 
 # DrawingML namespace constant
 _DRAWINGML_NS = {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
 
+# Precompiled XPath objects for every fixed query in this module.
+# etree.find() re-parses the ElementPath expression and resolves the
+# namespace map on each call; compiling once at import removes that work
+# from the per-shape hot path. XPath objects return a list; call sites
+# take the first hit or None.
+# pylint: disable=c-extension-no-member
+# fontScheme lives at a fixed location in the theme schema
+# (/a:theme/a:themeElements/a:fontScheme); the explicit paths avoid a
+# recursive descent over the whole theme document. The /@typeface tail
+# returns the attribute string directly, collapsing tree walk plus
+# attribute get into one evaluator call per font slot.
+_THEME_TYPEFACE_PATHS = {
+    "major_latin": "./a:themeElements/a:fontScheme/a:majorFont/a:latin/@typeface",
+    "major_ea": "./a:themeElements/a:fontScheme/a:majorFont/a:ea/@typeface",
+    "minor_latin": "./a:themeElements/a:fontScheme/a:minorFont/a:latin/@typeface",
+    "minor_ea": "./a:themeElements/a:fontScheme/a:minorFont/a:ea/@typeface",
+}
+_XP_RPR = etree.XPath("a:rPr", namespaces=_DRAWINGML_NS)
+# Merged paths: one XPath dispatch walks straight to the defRPr instead of
+# stepping through each intermediate element with its own query
+_XP_PPR_DEF_RPR = etree.XPath("./a:pPr/a:defRPr", namespaces=_DRAWINGML_NS)
+_XP_LSTSTYLE_DEF_RPR = etree.XPath(
+    "./a:lstStyle/a:lvl1pPr/a:defRPr", namespaces=_DRAWINGML_NS
+)
+# Spacing attribute extraction for get_placeholder_paragraph_defaults: each
+# expression walks to the val attribute in one native traversal and converts
+# it with XPath's number() in libxml2, so no Element or string objects
+# surface to Python. number() yields NaN when the attribute is absent.
+_XP_LNSPC_PCT_VAL = etree.XPath(
+    "number(./a:lnSpc/a:spcPct/@val)", namespaces=_DRAWINGML_NS
+)
+_XP_LNSPC_PTS_VAL = etree.XPath(
+    "number(./a:lnSpc/a:spcPts/@val)", namespaces=_DRAWINGML_NS
+)
+_XP_SPCBEF_PTS_VAL = etree.XPath(
+    "number(./a:spcBef/a:spcPts/@val)", namespaces=_DRAWINGML_NS
+)
+_XP_SPCBEF_PCT = etree.XPath("./a:spcBef/a:spcPct", namespaces=_DRAWINGML_NS)
+_XP_SPCAFT_PTS_VAL = etree.XPath(
+    "number(./a:spcAft/a:spcPts/@val)", namespaces=_DRAWINGML_NS
+)
+_XP_SPCAFT_PCT = etree.XPath("./a:spcAft/a:spcPct", namespaces=_DRAWINGML_NS)
+
+
+# Clark-notation tag names used by get_placeholder_paragraph_defaults,
+# resolved once at import. qn() splits the prefixed name and rebuilds the
+# namespace-qualified string on every call; these lookups run per shape.
+_QN_LATIN = qn("a:latin")
+_QN_EA = qn("a:ea")
+_QN_PPR = qn("a:pPr")
+_QN_TXBODY = qn("p:txBody")
+_QN_LSTSTYLE = qn("a:lstStyle")
+_QN_LVL1PPR = qn("a:lvl1pPr")
+
+
+# Minimal parser for theme XML: no ID table collection, entity resolution,
+# or network access — none of which theme documents need — and blank text
+# stripped during tree construction
+_THEME_PARSER = etree.XMLParser(
+    collect_ids=False,
+    resolve_entities=False,
+    no_network=True,
+    remove_blank_text=True,
+)
+
+
+def _find_first(xpath: "etree.XPath", elem: Any) -> Any:
+    """Run a compiled XPath and return the first match or None."""
+    nodes = xpath(elem)
+    return nodes[0] if nodes else None
+
+
+# Theme fonts memoized per presentation part: the theme XML is immutable for
+# the lifetime of the loaded object, and get_theme_fonts is typically called
+# per shape or per slide in a loop. Keyed by prs.part because the
+# Presentation proxy itself defines __eq__ without __hash__; weak keys let
+# the entry die with the presentation.
+_theme_fonts_by_prs: "weakref.WeakKeyDictionary[Any, Dict[str, Optional[str]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Layout placeholders indexed by idx, memoized per layout part. Every text
+# shape on a slide walks its layout's placeholders to find the matching idx;
+# the index turns that O(N) descriptor scan into one dict lookup. Weak keys
+# as above.
+_layout_ph_index: "weakref.WeakKeyDictionary[Any, Dict[int, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_layout_placeholder(layout: Any, ph_idx: int) -> Any:
+    """
+    Look up a layout placeholder by idx via a per-layout index.
+
+    Args:
+        layout: The slide layout owning the placeholders.
+        ph_idx (int): The placeholder idx to find.
+    Returns:
+        The matching layout placeholder, or None.
+    """
+    cache_key = getattr(layout, "part", None)
+    if cache_key is not None:
+        try:
+            index = _layout_ph_index.get(cache_key)
+        except TypeError:
+            cache_key = None
+            index = None
+        if index is not None:
+            return index.get(ph_idx)
+
+    index = {ph.placeholder_format.idx: ph for ph in layout.placeholders}
+    if cache_key is not None:
+        try:
+            _layout_ph_index[cache_key] = index
+        except TypeError:
+            pass
+    return index.get(ph_idx)
+
+# Theme font reference mapping (e.g. "+mj-lt" -> theme_fonts key), shared by
+# every _resolve_theme_font_reference call
+_THEME_REF_MAP = {
+    "+mj-lt": "major_latin",
+    "+mn-lt": "minor_latin",
+    "+mj-ea": "major_ea",
+    "+mn-ea": "minor_ea",
+}
+
 # Line spacing type constants
 # Per ISO/IEC 29500-1 §21.1.2.2.5 (lnSpc - Line Spacing):
 # "This can be specified in two different ways, percentage spacing and font point spacing."
@@ -53,19 +186,8 @@ def _resolve_theme_font_reference(
     if not typeface or not theme_fonts:
         return None
 
-    # Theme font reference mapping
-    theme_ref_map = {
-        "+mj-lt": "major_latin",
-        "+mn-lt": "minor_latin",
-        "+mj-ea": "major_ea",
-        "+mn-ea": "minor_ea",
-    }
-
-    if typeface in theme_ref_map:
-        theme_key = theme_ref_map[typeface]
-        return theme_fonts.get(theme_key)
-
-    return None
+    theme_key = _THEME_REF_MAP.get(typeface)
+    return theme_fonts.get(theme_key) if theme_key else None
 
 
 # ---------------------------
@@ -85,8 +207,20 @@ def get_theme_fonts(prs: Any) -> Dict[str, Optional[str]]:
         prs: PowerPoint Presentation object.
     Returns:
         Dictionary with 'major_latin', 'major_ea', 'minor_latin', 'minor_ea' keys.
-        Values are font names or None if not defined.
+        Values are font names or None if not defined. Also carries a private
+        '_fallback' key with the precomputed shape-font fallback chain.
     """
+    cache_key = getattr(prs, "part", None)
+    if cache_key is not None:
+        try:
+            cached = _theme_fonts_by_prs.get(cache_key)
+        except TypeError:
+            # Unhashable / non-weakrefable stand-in; skip the cache
+            cache_key = None
+            cached = None
+        if cached is not None:
+            return cached
+
     result: Dict[str, Optional[str]] = {
         "major_latin": None,
         "major_ea": None,
@@ -99,38 +233,42 @@ def get_theme_fonts(prs: Any) -> Dict[str, Optional[str]]:
         master_part = master.part
         theme_part = master_part.part_related_by(RT.THEME)
 
-        # Parse theme XML
-        # pylint: disable=protected-access
-        theme_xml = theme_part._blob
-        # pylint: disable=c-extension-no-member
-        root = etree.fromstring(theme_xml)
-
-        # Find fontScheme
-        font_scheme = root.find(".//a:fontScheme", _DRAWINGML_NS)
-
-        if font_scheme is not None:
-            # Major fonts (headings)
-            major = font_scheme.find("a:majorFont", _DRAWINGML_NS)
-            if major is not None:
-                latin = major.find("a:latin", _DRAWINGML_NS)
-                ea = major.find("a:ea", _DRAWINGML_NS)
-                if latin is not None:
-                    result["major_latin"] = latin.get("typeface")
-                if ea is not None:
-                    result["major_ea"] = ea.get("typeface")
-
-            # Minor fonts (body)
-            minor = font_scheme.find("a:minorFont", _DRAWINGML_NS)
-            if minor is not None:
-                latin = minor.find("a:latin", _DRAWINGML_NS)
-                ea = minor.find("a:ea", _DRAWINGML_NS)
-                if latin is not None:
-                    result["minor_latin"] = latin.get("typeface")
-                if ea is not None:
-                    result["minor_ea"] = ea.get("typeface")
+        # Reuse the part's already-parsed root; python-pptx XmlPart keeps
+        # the lxml tree, so re-parsing the blob would repeat a full XML
+        # tokenize/parse pass. Parts that only expose the raw blob fall
+        # back to parsing it.
+        try:
+            root = theme_part.element
+        except AttributeError:
+            # pylint: disable=protected-access
+            # pylint: disable=c-extension-no-member
+            root = etree.fromstring(theme_part._blob, _THEME_PARSER)
+
+        # One evaluator bound to the theme document serves all four
+        # typeface queries; each returns the attribute string directly
+        evaluator = etree.XPathEvaluator(root, namespaces=_DRAWINGML_NS)
+        for slot, path in _THEME_TYPEFACE_PATHS.items():
+            values = evaluator(path)
+            if values:
+                result[slot] = values[0]
+
+        # Precompute the shape-font fallback chain once per theme so
+        # get_shape_font resolves it with a single lookup per shape
+        result["_fallback"] = (
+            result["minor_ea"]
+            or result["major_ea"]
+            or result["minor_latin"]
+            or result["major_latin"]
+        )
     # pylint: disable=broad-except
     except Exception as e:
-        print(f"[WARN] Could not get theme fonts: {e}")
+        logger.warning("Could not get theme fonts: %s", e)
+
+    if cache_key is not None:
+        try:
+            _theme_fonts_by_prs[cache_key] = result
+        except TypeError:
+            pass
 
     return result
 
@@ -157,10 +295,10 @@ def get_shape_font(
     Returns:
         Font name string, or None if no font could be determined.
     """
-    if not hasattr(shape, "text_frame") or shape.text_frame is None:
+    tf = getattr(shape, "text_frame", None)
+    if tf is None:
         return None
 
-    tf = shape.text_frame
     if not tf.paragraphs:
         return None
 
@@ -168,90 +306,95 @@ def get_shape_font(
         """Extract font name from rPr element (ea first, then latin)."""
         if rpr_elem is None:
             return None
-        # Try East Asian font first
-        ea = rpr_elem.find("a:ea", _DRAWINGML_NS)
+        # One walk over the rPr children picks up both ea and latin
+        # instead of two separate scans
+        ea = latin = None
+        for child in rpr_elem.iterchildren(_QN_EA, _QN_LATIN):
+            if child.tag == _QN_EA:
+                if ea is None:
+                    ea = child
+            elif latin is None:
+                latin = child
+        # Try East Asian font first. Theme references are resolved inline:
+        # the single-char probe and direct map lookup avoid a function call
+        # for the overwhelmingly common concrete-typeface case.
         if ea is not None:
             ea_typeface = ea.get("typeface")
             if ea_typeface:
-                if ea_typeface.startswith("+"):
-                    resolved = _resolve_theme_font_reference(ea_typeface, theme_fonts)
-                    if resolved:
-                        return resolved
+                if ea_typeface[0] == "+":
+                    if theme_fonts:
+                        key = _THEME_REF_MAP.get(ea_typeface)
+                        resolved = theme_fonts.get(key) if key else None
+                        if resolved:
+                            return resolved
                 else:
                     return ea_typeface
         # Fall back to Latin font
-        latin = rpr_elem.find("a:latin", _DRAWINGML_NS)
         if latin is not None:
             latin_typeface = latin.get("typeface")
             if latin_typeface:
-                if latin_typeface.startswith("+"):
-                    resolved = _resolve_theme_font_reference(
-                        latin_typeface, theme_fonts
-                    )
-                    if resolved:
-                        return resolved
+                if latin_typeface[0] == "+":
+                    if theme_fonts:
+                        key = _THEME_REF_MAP.get(latin_typeface)
+                        resolved = theme_fonts.get(key) if key else None
+                        if resolved:
+                            return resolved
                 else:
                     return latin_typeface
         return None
 
     p = tf.paragraphs[0]
 
+    # The run._r / p._p / tf._txBody accessors are stable python-pptx
+    # internals; no exception guards so the common path stays tight.
+    # Empty paragraphs (common for title placeholders) carry neither runs
+    # nor a pPr, so both explicit-formatting steps are skipped outright.
+    # pylint: disable=protected-access
+    p_elem = p._p
+    runs = p.runs
+    has_ppr = p_elem.find(_QN_PPR) is not None
+
     # 1. Try first run's rPr (highest priority)
-    if p.runs:
-        run = p.runs[0]
-        try:
-            # pylint: disable=protected-access
-            r_elem = run._r
-            rpr = r_elem.find("a:rPr", _DRAWINGML_NS)
-            font = _get_font_from_rpr(rpr)
-            if font:
-                return font
-        except AttributeError as e:
-            # python-pptx internal structure access failed (version compatibility issue)
-            print(f"[DEBUG] Could not access run element: {e}")
-
-        # Also check font.name via python-pptx API
-        if run.font.name:
-            if run.font.name.startswith("+"):
-                resolved = _resolve_theme_font_reference(run.font.name, theme_fonts)
-                if resolved:
-                    return resolved
-            else:
-                return run.font.name
-
-    # 2. Try paragraph's pPr > defRPr
-    try:
-        # pylint: disable=protected-access
-        p_elem = p._p
-        ppr = p_elem.find("a:pPr", _DRAWINGML_NS)
-        if ppr is not None:
-            def_rpr = ppr.find("a:defRPr", _DRAWINGML_NS)
-            font = _get_font_from_rpr(def_rpr)
-            if font:
-                return font
-    except AttributeError as e:
-        # python-pptx internal structure access failed (version compatibility issue)
-        print(f"[DEBUG] Could not access paragraph element: {e}")
-
-    # 3. Try text frame's lstStyle > lvl1pPr > defRPr
-    try:
-        # pylint: disable=protected-access
-        tx_body = tf._txBody
-        lst_style = tx_body.find("a:lstStyle", _DRAWINGML_NS)
-        if lst_style is not None:
-            lvl1_ppr = lst_style.find("a:lvl1pPr", _DRAWINGML_NS)
-            if lvl1_ppr is not None:
-                def_rpr = lvl1_ppr.find("a:defRPr", _DRAWINGML_NS)
-                font = _get_font_from_rpr(def_rpr)
-                if font:
-                    return font
-    except AttributeError as e:
-        # python-pptx internal structure access failed (version compatibility issue)
-        print(f"[DEBUG] Could not access text body element: {e}")
+    if runs:
+        run = runs[0]
+        rpr = _find_first(_XP_RPR, run._r)
+        font = _get_font_from_rpr(rpr)
+        if font:
+            return font
+
+        # The python-pptx API re-walks the same rPr, so it can only add
+        # information when the XML pass saw no rPr at all (safety net for
+        # structures the direct access above could not reach)
+        if rpr is None:
+            font_name = run.font.name
+            if font_name:
+                if font_name[0] == "+":
+                    resolved = _resolve_theme_font_reference(font_name, theme_fonts)
+                    if resolved:
+                        return resolved
+                else:
+                    return font_name
+
+    # 2. Try paragraph's pPr > defRPr (one merged XPath dispatch)
+    if has_ppr:
+        def_rpr = _find_first(_XP_PPR_DEF_RPR, p_elem)
+        font = _get_font_from_rpr(def_rpr)
+        if font:
+            return font
+
+    # 3. Try text frame's lstStyle > lvl1pPr > defRPr (one merged XPath dispatch)
+    def_rpr = _find_first(_XP_LSTSTYLE_DEF_RPR, tf._txBody)
+    font = _get_font_from_rpr(def_rpr)
+    if font:
+        return font
 
     # 4. Fallback to theme fonts (minor_ea > major_ea > minor_latin > major_latin)
     # Per ISO/IEC 29500-1: when defRPr is omitted, application uses theme defaults
     if theme_fonts:
+        # get_theme_fonts precomputes the chain; re-derive it only for
+        # dicts built elsewhere that lack the key
+        if "_fallback" in theme_fonts:
+            return theme_fonts["_fallback"]
         return (
             theme_fonts.get("minor_ea")
             or theme_fonts.get("major_ea")
@@ -373,13 +516,9 @@ def get_placeholder_paragraph_defaults(shape: Any) -> ParagraphDefaults:
     slide = shape.part.slide
     layout = slide.slide_layout
 
-    # Find matching placeholder in layout by idx
+    # Find matching placeholder in layout by idx (indexed per layout)
     ph_idx = shape.placeholder_format.idx
-    layout_shape = None
-    for ph in layout.placeholders:
-        if ph.placeholder_format.idx == ph_idx:
-            layout_shape = ph
-            break
+    layout_shape = _get_layout_placeholder(layout, ph_idx)
 
     if layout_shape is None:
         return result
@@ -388,16 +527,16 @@ def get_placeholder_paragraph_defaults(shape: Any) -> ParagraphDefaults:
     # Note: _element access is required for XML parsing, python-pptx doesn't expose this
     # Variable names reflect XML element names but use snake_case
     # pylint: disable=protected-access
-    tx_body = layout_shape._element.find(qn("p:txBody"))
+    tx_body = layout_shape._element.find(_QN_TXBODY)
     if tx_body is None:
         return result
 
-    lst_style = tx_body.find(qn("a:lstStyle"))
+    lst_style = tx_body.find(_QN_LSTSTYLE)
     if lst_style is None:
         return result
 
     # Get lvl1pPr (level 1 = bullet level 0)
-    lvl1_ppr = lst_style.find(qn("a:lvl1pPr"))
+    lvl1_ppr = lst_style.find(_QN_LVL1PPR)
     if lvl1_ppr is None:
         return result
 
@@ -405,50 +544,45 @@ def get_placeholder_paragraph_defaults(shape: Any) -> ParagraphDefaults:
     # Per ISO/IEC 29500-1 §21.1.2.2.5:
     # "This element specifies the vertical line spacing... This can be specified
     # in two different ways, percentage spacing and font point spacing."
-    ln_spc = lvl1_ppr.find(qn("a:lnSpc"))
-    if ln_spc is not None:
-        # Check for percentage-based spacing (spcPct)
+    # Each compiled expression converts the val attribute to a float in
+    # libxml2; NaN marks absence.
+    pct_val = _XP_LNSPC_PCT_VAL(lvl1_ppr)
+    if not math.isnan(pct_val):
+        # Percentage-based spacing (spcPct)
         # Per ISO/IEC 29500-1 §21.1.2.2.11: value is in 1/100000 of a percent
-        # Example: 100000 = 100% = single spacing
-        spc_pct = ln_spc.find(qn("a:spcPct"))
-        # Check for fixed point spacing (spcPts)
-        # Per ISO/IEC 29500-1 §21.1.2.2.12: value is in 1/100 of a point
-        # Example: 1400 = 14 points
-        spc_pts = ln_spc.find(qn("a:spcPts"))
-        if spc_pct is not None:
-            # Convert from 1/100000 percent to ratio (100000 -> 1.0)
-            result["line_spacing"] = int(spc_pct.get("val")) / 100000
-            result["line_spacing_type"] = LINE_SPACING_TYPE_RATIO
-        elif spc_pts is not None:
+        # Convert from 1/100000 percent to ratio (100000 -> 1.0)
+        result["line_spacing"] = pct_val / 100000
+        result["line_spacing_type"] = LINE_SPACING_TYPE_RATIO
+    else:
+        pts_val = _XP_LNSPC_PTS_VAL(lvl1_ppr)
+        if not math.isnan(pts_val):
+            # Fixed point spacing (spcPts)
+            # Per ISO/IEC 29500-1 §21.1.2.2.12: value is in 1/100 of a point
             # Convert from 1/100 points to points (1400 -> 14.0)
             # This value represents the total line height, not additional spacing
-            result["line_spacing"] = int(spc_pts.get("val")) / 100
+            result["line_spacing"] = pts_val / 100
             result["line_spacing_type"] = LINE_SPACING_TYPE_FIXED
 
     # Extract space before (spcBef)
     # Note: Only spcPts (fixed points) is supported. spcPct (percentage) is not implemented
     # because it requires font size context which is not available at this stage.
-    spc_bef = lvl1_ppr.find(qn("a:spcBef"))
-    if spc_bef is not None:
-        spc_pts = spc_bef.find(qn("a:spcPts"))
-        if spc_pts is not None:
-            result["space_before_pt"] = int(spc_pts.get("val")) / 100
-        elif spc_bef.find(qn("a:spcPct")) is not None:
-            print(
-                "[WARN] spcBef with spcPct (percentage) is not supported; using default (0.0)"
-            )
+    bef_val = _XP_SPCBEF_PTS_VAL(lvl1_ppr)
+    if not math.isnan(bef_val):
+        result["space_before_pt"] = bef_val / 100
+    elif _XP_SPCBEF_PCT(lvl1_ppr):
+        logger.warning(
+            "spcBef with spcPct (percentage) is not supported; using default (0.0)"
+        )
 
     # Extract space after (spcAft)
     # Note: Only spcPts (fixed points) is supported. spcPct (percentage) is not implemented
     # because it requires font size context which is not available at this stage.
-    spc_aft = lvl1_ppr.find(qn("a:spcAft"))
-    if spc_aft is not None:
-        spc_pts = spc_aft.find(qn("a:spcPts"))
-        if spc_pts is not None:
-            result["space_after_pt"] = int(spc_pts.get("val")) / 100
-        elif spc_aft.find(qn("a:spcPct")) is not None:
-            print(
-                "[WARN] spcAft with spcPct (percentage) is not supported; using default (0.0)"
-            )
+    aft_val = _XP_SPCAFT_PTS_VAL(lvl1_ppr)
+    if not math.isnan(aft_val):
+        result["space_after_pt"] = aft_val / 100
+    elif _XP_SPCAFT_PCT(lvl1_ppr):
+        logger.warning(
+            "spcAft with spcPct (percentage) is not supported; using default (0.0)"
+        )
 
     return result